@@ -1,17 +1,71 @@
 import csv
+import io
 import json
 import re
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+
+try:
+    import orjson  # optional C encoder
+except ImportError:
+    orjson = None
+
+_YEAR_RE = re.compile(r'(\d{4})')
+_DIGITAL_RE = re.compile(r'online|digital|website|multimedia', re.I)
+_PRINT_RE = re.compile(r'print', re.I)
 
 def parse_year(year_str):
     """Extract year as integer from various formats."""
     if not year_str or year_str.strip() in ['', '?', 'Unknown']:
         return None
     # Extract first 4-digit number
-    match = re.search(r'(\d{4})', str(year_str))
+    match = _YEAR_RE.search(year_str if isinstance(year_str, str) else str(year_str))
     if match:
         return int(match.group(1))
     return None
 
+@dataclass(slots=True)
+class Publication:
+    """One publication record. Field names and order mirror the JSON keys."""
+    id: int
+    name: str
+    alternateName: str | None
+    city: str | None
+    publishers: str | None
+    yearFounded: int | None
+    yearCeased: int | None
+    frequency: str | None
+    format: str | None
+    languages: str
+    archiveUrl: str | None
+    websiteUrl: str | None
+    targetAudience: str | None
+    primaryFocus: str | None
+    medium: str
+    missionStatement: str | None
+    keyStaff: str | None
+    historicalNotes: str | None
+    isActive: bool
+    decade: str
+    isFeaturedHistoric: bool
+    isFeaturedContemporary: bool
+
+def write_json(obj, path):
+    """Write obj as indented UTF-8 JSON, via orjson if installed."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2, ensure_ascii=False, default=asdict).encode('utf-8')
+    with open(path, 'wb') as f:
+        f.write(data)
+
+_shared = {}
+
+def shared(value):
+    """Return one canonical copy of a repeated string value (None passes through)."""
+    return _shared.setdefault(value, value) if value else value
+
+@lru_cache(maxsize=None)
 def get_decade(year):
     """Get decade string from year."""
     if year is None:
@@ -19,18 +73,18 @@ def get_decade(year):
     decade_start = (year // 10) * 10
     return f"{decade_start}s"
 
+@lru_cache(maxsize=None)
 def determine_medium(medium_str, format_str):
     """Determine if Print, Digital, or Print/Digital."""
+    if not medium_str and not format_str:
+        return "Print"
     if not medium_str:
         medium_str = ""
     if not format_str:
         format_str = ""
 
-    medium_lower = medium_str.lower()
-    format_lower = format_str.lower()
-
-    has_digital = any(x in medium_lower or x in format_lower for x in ['online', 'digital', 'website', 'multimedia'])
-    has_print = any(x in medium_lower for x in ['print'])
+    has_digital = bool(_DIGITAL_RE.search(medium_str) or _DIGITAL_RE.search(format_str))
+    has_print = bool(_PRINT_RE.search(medium_str))
 
     if has_digital and has_print:
         return "Print/Digital"
@@ -50,91 +104,95 @@ featured_contemporary = [
     "Trenton Journal", "New Jersey Urban News", "NJ Urban News", "Ark Republic", "The Nubian News", "Black In Jersey"
 ]
 
-def is_featured_historic(name):
-    if not name:
-        return False
-    name_clean = name.strip()
-    for featured in featured_historic:
-        if featured.lower() in name_clean.lower() or name_clean.lower() in featured.lower():
-            return True
-    return False
-
-def is_featured_contemporary(name):
-    if not name:
-        return False
-    name_clean = name.strip()
-    for featured in featured_contemporary:
-        if featured.lower() in name_clean.lower() or name_clean.lower() in featured.lower():
-            return True
-    return False
+# Lowercased once at import so the row loop only lowercases each name.
+# The sets catch exact matches; the lists back the substring fallback.
+_HIST_LC = [f.lower() for f in featured_historic]
+_CONT_LC = [f.lower() for f in featured_contemporary]
+_HIST_SET = frozenset(_HIST_LC)
+_CONT_SET = frozenset(_CONT_LC)
 
 publications = []
 cities = set()
 decades = set()
 formats = set()
+active_count = 0
 
 with open('publications.csv', 'r', encoding='utf-8-sig') as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        pub_id = row.get('ID', '').strip()
+    # Read the export in one call and parse it from memory
+    reader = csv.reader(io.StringIO(f.read()))
+    header = next(reader, [])
+    for raw_row in reader:
+        # Strip every cell in one pass; zip drops overflow cells and short
+        # rows simply lack the trailing keys.
+        row = dict(zip(header, [c.strip() for c in raw_row]))
+        get = row.get  # bound once; used for every field below
+
+        pub_id = get('ID', '')
         if not pub_id or not pub_id.isdigit():
             continue
 
-        name = row.get('Publication', '').strip() or None
+        name = get('Publication') or None
         if not name:
             continue
 
-        alternate_name = row.get('Alternate Name', '').strip() or None
-        city = row.get('Location (City)', '').strip() or None
-        publishers = row.get('Owners/Publishers', '').strip() or None
-        year_founded = parse_year(row.get('Year founded', ''))
-        year_ceased = parse_year(row.get('Year ceased', ''))
-        frequency = row.get('Frequency of publication', '').strip() or None
-        format_val = row.get('Format', '').strip() or None
-        languages = row.get('Languages published', '').strip() or "English"
-        archive_url = row.get('Archive/Call Number', '').strip() or None
-        website_url = row.get('Website/Archive', '').strip() or None
-        target_audience = row.get('HMerge:Target audience', '').strip() or None
-        primary_focus = row.get('Primary focus/Content areas', '').strip() or None
-        medium_raw = row.get('Medium/Distribution method (e.g. Print, Digital)', '').strip()
+        alternate_name = get('Alternate Name') or None
+        city = shared(get('Location (City)') or None)
+        publishers = get('Owners/Publishers') or None
+        year_founded = parse_year(get('Year founded', ''))
+        year_ceased = parse_year(get('Year ceased', ''))
+        frequency = shared(get('Frequency of publication') or None)
+        format_val = shared(get('Format') or None)
+        languages = shared(get('Languages published') or "English")
+        archive_url = get('Archive/Call Number') or None
+        website_url = get('Website/Archive') or None
+        target_audience = get('HMerge:Target audience') or None
+        primary_focus = get('Primary focus/Content areas') or None
+        medium_raw = get('Medium/Distribution method (e.g. Print, Digital)', '')
         medium = determine_medium(medium_raw, format_val)
-        mission_statement = row.get('Mission statement or editorial philosophy', '').strip() or None
-        key_staff = row.get('Key staff members', '').strip() or None
-        historical_notes = row.get('Historical notes + impact', '').strip() or None
+        mission_statement = get('Mission statement or editorial philosophy') or None
+        key_staff = get('Key staff members') or None
+        historical_notes = get('Historical notes + impact') or None
 
         # Determine if active
-        year_ceased_raw = row.get('Year ceased', '').strip()
+        year_ceased_raw = get('Year ceased', '')
         is_active = year_ceased_raw in ['', '?', None] or year_ceased is None
 
-        decade = get_decade(year_founded)
-
-        pub = {
-            "id": int(pub_id),
-            "name": name,
-            "alternateName": alternate_name,
-            "city": city,
-            "publishers": publishers,
-            "yearFounded": year_founded,
-            "yearCeased": year_ceased,
-            "frequency": frequency,
-            "format": format_val,
-            "languages": languages,
-            "archiveUrl": archive_url,
-            "websiteUrl": website_url,
-            "targetAudience": target_audience,
-            "primaryFocus": primary_focus,
-            "medium": medium,
-            "missionStatement": mission_statement,
-            "keyStaff": key_staff,
-            "historicalNotes": historical_notes,
-            "isActive": is_active,
-            "decade": decade,
-            "isFeaturedHistoric": is_featured_historic(name),
-            "isFeaturedContemporary": is_featured_contemporary(name)
-        }
+        decade = shared(get_decade(year_founded))
+
+        # Featured match: either name may contain the other
+        name_lc = name.lower()
+        featured_hist = name_lc in _HIST_SET or any(f in name_lc or name_lc in f for f in _HIST_LC)
+        featured_cont = name_lc in _CONT_SET or any(f in name_lc or name_lc in f for f in _CONT_LC)
+
+        pub = Publication(
+            id=int(pub_id),
+            name=name,
+            alternateName=alternate_name,
+            city=city,
+            publishers=publishers,
+            yearFounded=year_founded,
+            yearCeased=year_ceased,
+            frequency=frequency,
+            format=format_val,
+            languages=languages,
+            archiveUrl=archive_url,
+            websiteUrl=website_url,
+            targetAudience=target_audience,
+            primaryFocus=primary_focus,
+            medium=medium,
+            missionStatement=mission_statement,
+            keyStaff=key_staff,
+            historicalNotes=historical_notes,
+            isActive=is_active,
+            decade=decade,
+            isFeaturedHistoric=featured_hist,
+            isFeaturedContemporary=featured_cont
+        )
 
         publications.append(pub)
 
+        if is_active:
+            active_count += 1
         if city:
             cities.add(city)
         if decade != "Unknown":
@@ -143,16 +201,16 @@ with open('publications.csv', 'r', encoding='utf-8-sig') as f:
             formats.add(format_val)
 
 # Sort publications by ID
-publications.sort(key=lambda x: x['id'])
+publications.sort(key=lambda x: x.id)
 
-# Calculate counts
-active_count = sum(1 for p in publications if p['isActive'])
+# Calculate counts (active_count is tallied in the row loop)
 ceased_count = len(publications) - active_count
 
 # Sort metadata arrays
-cities_list = sorted(list(cities))
-decades_list = sorted(list(decades), key=lambda x: int(x[:-1]) if x != "Unknown" else 9999)
-formats_list = sorted(list(formats))
+# decades never holds "Unknown", so every entry parses as "<year>s"
+cities_list = sorted(cities)
+decades_list = [d for _, d in sorted((int(d[:-1]), d) for d in decades)]
+formats_list = sorted(formats)
 
 output = {
     "metadata": {
@@ -166,8 +224,7 @@ output = {
     "publications": publications
 }
 
-with open('publications.json', 'w', encoding='utf-8') as f:
-    json.dump(output, f, indent=2, ensure_ascii=False)
+write_json(output, 'publications.json')
 
 print(f"Generated publications.json with {len(publications)} publications")
 print(f"Active: {active_count}, Ceased: {ceased_count}")
@@ -7,78 +7,146 @@ Only fills in gaps - does not overwrite existing non-null values.
 
 import json
 import os
-import glob
+import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson  # optional C parser/encoder
+except ImportError:
+    orjson = None
 
 PUBLICATIONS_PATH = 'publications.json'
 FEATURED_PATH = 'featured-publications.json'
 RESEARCH_DIR = 'research'
+READ_WORKERS = 8
+
+# Fields that can be filled from research
+_FILLABLE_FIELDS = (
+    'archiveUrl', 'websiteUrl', 'missionStatement', 'historicalNotes',
+    'primaryFocus', 'targetAudience', 'keyStaff', 'alternateName',
+    'frequency', 'format', 'languages'
+)
+
+def read_json(path):
+    """Parse a UTF-8 JSON file, using orjson when installed."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def write_json_if_changed(obj, path):
+    """Write obj as indented UTF-8 JSON unless the file already holds those bytes; return True if written."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return True
+
 
 def merge_publication(existing, research):
-    """Merge research data into existing publication, filling gaps only."""
-    updated = dict(existing)
-    fields_updated = []
+    """Merge research data into existing publication in place, filling gaps only.
 
-    # Fields that can be filled from research
-    fillable_fields = [
-        'archiveUrl', 'websiteUrl', 'missionStatement', 'historicalNotes',
-        'primaryFocus', 'targetAudience', 'keyStaff', 'alternateName',
-        'frequency', 'format', 'languages'
-    ]
+    Returns the list of fields that were filled.
+    """
+    fields_updated = []
 
-    for field in fillable_fields:
-        if field in research and research[field]:
-            if not existing.get(field):
-                updated[field] = research[field]
-                fields_updated.append(field)
+    # Walk the fields in their fixed order so the report is deterministic
+    for field in _FILLABLE_FIELDS:
+        value = research.get(field)
+        if value and not existing.get(field):
+            existing[field] = value
+            fields_updated.append(field)
 
-    return updated, fields_updated
+    return fields_updated
 
 
 def main():
     # Load existing publications
-    with open(PUBLICATIONS_PATH, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    data = read_json(PUBLICATIONS_PATH)
+
+    # Index by id and count active records in the same pass. A repeated id
+    # replaces the earlier record (last one wins), so back out the replaced
+    # record's contribution. isActive is not a fillable field, so the merge
+    # itself leaves the count alone.
+    publications = {}
+    active_count = 0
+    for p in data['publications']:
+        replaced = publications.get(p['id'])
+        if replaced is not None and replaced['isActive']:
+            active_count -= 1
+        publications[p['id']] = p
+        if p['isActive']:
+            active_count += 1
 
-    publications = {p['id']: p for p in data['publications']}
     total_updates = 0
-    field_counts = {}
+    field_counts = Counter()
+    log_lines = []
 
     # Load all research files
-    research_files = glob.glob(os.path.join(RESEARCH_DIR, '*.json'))
+    research_files = []
+    if os.path.isdir(RESEARCH_DIR):
+        with os.scandir(RESEARCH_DIR) as entries:
+            research_files = sorted(
+                e.path for e in entries
+                if e.name.endswith('.json') and not e.name.startswith('.') and e.is_file()
+            )
     print(f"Found {len(research_files)} research files")
 
-    for filepath in sorted(research_files):
-        with open(filepath, 'r', encoding='utf-8') as f:
-            research_data = json.load(f)
+    # Read and parse files concurrently; map() keeps them in sorted order so
+    # the serial merge below stays deterministic
+    with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+        parsed = list(executor.map(read_json, research_files))
 
+    for research_data in parsed:
         findings = research_data if isinstance(research_data, list) else research_data.get('findings', [])
 
         for finding in findings:
             pub_id = finding.get('id')
             if pub_id and pub_id in publications:
-                updated, fields = merge_publication(publications[pub_id], finding)
+                fields = merge_publication(publications[pub_id], finding)
                 if fields:
-                    publications[pub_id] = updated
                     total_updates += 1
-                    for field in fields:
-                        field_counts[field] = field_counts.get(field, 0) + 1
-                    print(f"  Updated ID {pub_id} ({finding.get('name', '?')}): {', '.join(fields)}")
+                    field_counts.update(fields)
+                    log_lines.append(f"  Updated ID {pub_id} ({finding.get('name', '?')}): {', '.join(fields)}")
 
-    # Rebuild output
-    data['publications'] = sorted(publications.values(), key=lambda x: x['id'])
+    # Emit the per-publication report in one write rather than one print per update
+    if log_lines:
+        sys.stdout.write('\n'.join(log_lines) + '\n')
 
-    # Recalculate metadata
-    active_count = sum(1 for p in data['publications'] if p['isActive'])
-    data['metadata']['activeCount'] = active_count
-    data['metadata']['ceasedCount'] = len(data['publications']) - active_count
+    # Rebuild output. Findings only update existing records in place, so
+    # the dict keeps the input file's (id-sorted) order and needs no re-sort.
+    data['publications'] = list(publications.values())
 
-    # Save updated publications
-    with open(PUBLICATIONS_PATH, 'w', encoding='utf-8') as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Recalculate metadata
+    metadata = data['metadata']
+    ceased_count = len(data['publications']) - active_count
+    counts_changed = (metadata.get('activeCount'), metadata.get('ceasedCount')) != (active_count, ceased_count)
+    metadata['activeCount'] = active_count
+    metadata['ceasedCount'] = ceased_count
+
+    # Save updated publications; a run that changed nothing skips
+    # serialization entirely
+    if total_updates or counts_changed:
+        if not write_json_if_changed(data, PUBLICATIONS_PATH):
+            print(f"{PUBLICATIONS_PATH} already up to date; skipping write.")
+    else:
+        print("No changes; skipping serialization and write.")
 
     print(f"\nTotal publications updated: {total_updates}")
     print(f"Fields filled:")
-    for field, count in sorted(field_counts.items(), key=lambda x: -x[1]):
+    for field, count in field_counts.most_common():
         print(f"  {field}: {count}")
 
 